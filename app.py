@@ -9,7 +9,8 @@ import requests
 from flask import Flask, render_template, request, send_file, after_this_request, jsonify
 from werkzeug.utils import secure_filename
 
-from extractor import extract_text_from_pdf
+from extractor import extract_pages_from_pdf
+from preprocessor import clean_pages
 from compressor import compress_text
 from generator_latex import create_cheat_sheet
 
@@ -167,15 +168,28 @@ def process_pipeline(job_id, file_paths):
     try:
         total_files = len(file_paths)
         combined_text = ""
+        tokens_before = 0
+        tokens_after = 0
 
         for i, path in enumerate(file_paths):
             filename = os.path.basename(path)
             JOBS[job_id]['status'] = f"Reading file {i+1} of {total_files}: {filename}..."
             JOBS[job_id]['percent'] = int((i / total_files) * 50)
             
-            text = extract_text_from_pdf(path)
-            if text:
-                combined_text += f"\n--- SOURCE: {filename} ---\n{text}"
+            pages = extract_pages_from_pdf(path)
+            if pages:
+                # Strip repeated headers/footers before they eat the prompt budget
+                text, prep_stats = clean_pages(pages)
+                tokens_before += prep_stats['tokens_before']
+                tokens_after += prep_stats['tokens_after']
+                print(f"Preprocessed {filename}: removed {prep_stats['removed_lines']} boilerplate lines, "
+                      f"saved ~{prep_stats['tokens_saved']} tokens")
+                if text:
+                    combined_text += f"\n--- SOURCE: {filename} ---\n{text}"
+
+        JOBS[job_id]['tokens_before'] = tokens_before
+        JOBS[job_id]['tokens_after'] = tokens_after
+        JOBS[job_id]['tokens_saved'] = tokens_before - tokens_after
 
         if not combined_text:
             JOBS[job_id]['status'] = "Error: No text found."
@@ -1,20 +1,20 @@
 import pdfplumber
 
-def extract_text_from_pdf(pdf_path):
+def extract_pages_from_pdf(pdf_path):
     """
-    Opens a PDF and extracts text page by page.
+    Opens a PDF and returns the text of each page as a list.
     """
     print(f"Reading {pdf_path}...")
-    full_text = ""
-    
+    pages = []
+
     try:
         with pdfplumber.open(pdf_path) as pdf:
             for page in pdf.pages:
                 text = page.extract_text()
                 if text:
-                    full_text += text + "\n"
+                    pages.append(text)
     except Exception as e:
         print(f"Error reading PDF: {e}")
         return None
-        
-    return full_text
\ No newline at end of file
+
+    return pages
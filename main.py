@@ -1,7 +1,8 @@
 import sys
 import os
 from generator_latex import create_cheat_sheet 
-from extractor import extract_text_from_pdf
+from extractor import extract_pages_from_pdf
+from preprocessor import clean_pages
 from compressor import compress_text, mock_compress
 
 CACHE_FILE = "combined_text_cache.txt"
@@ -24,10 +25,14 @@ def main():
 
         for pdf_path in input_files:
             if pdf_path.endswith(".pdf"):
-                text = extract_text_from_pdf(pdf_path)
-                if text:
-                    combined_text += f"\n--- SOURCE: {os.path.basename(pdf_path)} ---\n"
-                    combined_text += text
+                pages = extract_pages_from_pdf(pdf_path)
+                if pages:
+                    text, prep_stats = clean_pages(pages)
+                    print(f"Preprocessed {os.path.basename(pdf_path)}: "
+                          f"saved ~{prep_stats['tokens_saved']} of {prep_stats['tokens_before']} tokens")
+                    if text:
+                        combined_text += f"\n--- SOURCE: {os.path.basename(pdf_path)} ---\n"
+                        combined_text += text
         
         # SAVE THE CACHE so you never wait again
         if combined_text:
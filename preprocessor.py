@@ -0,0 +1,166 @@
+import re
+from collections import defaultdict
+
+# How many lines at the top/bottom of a page count as header/footer zone.
+# On short pages the zones split the page instead of overlapping.
+EDGE_LINES = 3
+
+# A line must show up at the same position on at least this share of pages
+# (and this many pages) before we treat it as boilerplate
+MIN_PAGE_RATIO = 0.6
+MIN_PAGES = 3
+
+# Rough chars-per-token ratio for Gemini models (no local tokenizer needed)
+CHARS_PER_TOKEN = 4
+
+_DIGITS = re.compile(r'\d+')
+_SPACES = re.compile(r'[ \t ]+')
+_WORDS = re.compile(r'[^\W\d_]+')
+_PARENS = re.compile(r'\([^)]*\)')
+# Join 'Auto-\nmaten' but keep coordinated forms like 'Ein-\nund Ausgabe'
+_HYPHEN_BREAK = re.compile(r'(?<=[^\W\d_])-\n(?!(?:und|oder|bis|sowie)\b)(?=[a-zäöüß]{2})')
+_BLANK_LINES = re.compile(r'\n{3,}')
+
+
+def _clean_line(line):
+    return _SPACES.sub(' ', line).strip()
+
+
+def _line_key(line):
+    """
+    Normalises a line so that 'Seite 3 von 40' and 'Seite 4 von 40' match.
+    Expects a line already passed through _clean_line.
+    """
+    return _DIGITS.sub('#', line.lower())
+
+
+def _edge_entries(lines):
+    """
+    Returns (zone, offset, key, line) for the header and footer zone of a page,
+    where offset counts from the nearest edge. Head entries come first, each
+    zone ordered from the edge inwards; no line belongs to both zones.
+    """
+    head = min(EDGE_LINES, (len(lines) + 1) // 2)
+    foot = min(EDGE_LINES, len(lines) - head)
+    entries = []
+    for offset, line in enumerate(lines[:head]):
+        line = _clean_line(line)
+        if line:
+            entries.append(('head', offset, _line_key(line), line))
+    for offset, line in enumerate(reversed(lines[len(lines) - foot:])):
+        line = _clean_line(line)
+        if line:
+            entries.append(('foot', offset, _line_key(line), line))
+    return entries
+
+
+def _counts_up(lines):
+    """
+    True if the numbers in the lines (in page order) never go down and
+    do go up overall, like page numbers with repeated build slides.
+    """
+    numbers = [tuple(int(n) for n in _DIGITS.findall(line)) for line in lines]
+    return all(a <= b for a, b in zip(numbers, numbers[1:])) and numbers[0] < numbers[-1]
+
+
+def _is_boilerplate(zone, offset, key, lines):
+    """
+    Decides whether a frequent edge line is a running header/footer
+    rather than a slide heading or content that happens to repeat.
+    `lines` holds every occurrence in page order.
+    """
+    constant = len(set(lines)) == 1
+    words = _WORDS.findall(_PARENS.sub('', key))
+    if len(words) == 1:
+        # 'Definition', 'Satz', 'Aufgabe 3 (4 Punkte)', 'Beweis (Forts.)' are
+        # headings; a single word only counts when it is verbatim identical
+        # everywhere and carries a number, e.g. 'Wintersemester 2024/25'
+        return '#' in key and constant
+    if constant:
+        # Course title, lecturer, date; a constant bare number is content
+        return bool(words) or key != '#'
+    # Counter lines like '119' or 'Seite 3 von 40': outermost line only,
+    # numbers rising with the pages, and worded counters only in the footer
+    if offset != 0 or not _counts_up(lines):
+        return False
+    return not words or zone == 'foot'
+
+
+def learn_boilerplate(edge_entries):
+    """
+    Learns which (zone, offset, key) triples repeat across the pages of one
+    document, given the _edge_entries of every page. Linear in the number of lines.
+    """
+    occurrences = defaultdict(list)
+    for entries in edge_entries:
+        for zone, offset, key, line in entries:
+            occurrences[(zone, offset, key)].append(line)
+
+    threshold = max(MIN_PAGES, int(len(edge_entries) * MIN_PAGE_RATIO))
+    return {
+        triple for triple, lines in occurrences.items()
+        if len(lines) >= threshold and _is_boilerplate(*triple, lines)
+    }
+
+
+def normalise_text(text):
+    """
+    Joins words hyphenated across line breaks and collapses whitespace.
+    """
+    text = _HYPHEN_BREAK.sub('', text)
+    lines = [_clean_line(line) for line in text.split('\n')]
+    return _BLANK_LINES.sub('\n\n', '\n'.join(lines)).strip()
+
+
+def estimate_tokens(text):
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def clean_pages(page_texts):
+    """
+    Strips repeated headers/footers (course title, lecturer, date, page number)
+    from a document's pages and normalises the remaining text.
+    Returns the cleaned text and a stats dict with the token savings.
+    If cleaning would leave nothing, the normalised raw text is returned instead.
+    """
+    pages = [text.split('\n') for text in page_texts]
+    edge_entries = [_edge_entries(lines) for lines in pages]
+    boilerplate = learn_boilerplate(edge_entries)
+
+    kept_pages = []
+    removed_lines = 0
+    for lines, entries in zip(pages, edge_entries):
+        # Strip from each edge inwards and stop at the first line that is not
+        # boilerplate, so a learned line deeper in the zone never eats content
+        drop = set()
+        stopped = set()
+        for zone, offset, key, _ in entries:
+            if zone in stopped:
+                continue
+            if (zone, offset, key) not in boilerplate:
+                stopped.add(zone)
+                continue
+            drop.add(offset if zone == 'head' else len(lines) - 1 - offset)
+        removed_lines += len(drop)
+        kept = [line for i, line in enumerate(lines) if i not in drop]
+        # Normalise per page so hyphen joins never cross a removed footer
+        page_text = normalise_text('\n'.join(kept))
+        if page_text:
+            kept_pages.append(page_text)
+
+    raw_text = '\n'.join(page_texts)
+    cleaned_text = '\n'.join(kept_pages)
+    if not cleaned_text:
+        cleaned_text = normalise_text(raw_text)
+        removed_lines = 0
+
+    tokens_before = estimate_tokens(raw_text)
+    tokens_after = estimate_tokens(cleaned_text)
+    stats = {
+        'pages': len(pages),
+        'removed_lines': removed_lines,
+        'tokens_before': tokens_before,
+        'tokens_after': tokens_after,
+        'tokens_saved': tokens_before - tokens_after,
+    }
+    return cleaned_text, stats
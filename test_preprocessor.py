@@ -0,0 +1,113 @@
+from preprocessor import clean_pages, normalise_text
+
+
+def _slides(n):
+    """Long slides with a running header/footer around real content."""
+    pages = []
+    for i in range(1, n + 1):
+        title = "Definition" if i % 2 else f"Aufgabe {i}"
+        pages.append(
+            "Grundlagen der Theoretischen Informatik\n"
+            "Wintersemester 2024/25\n"
+            f"{title}\n"
+            f"Inhalt {i} der Folie\n"
+            "x\n"
+            "2\n"
+            "Prof. Dr. Heribert Vollmer\n"
+            "06.01.25\n"
+            f"{100 + i}"
+        )
+    return pages
+
+
+def test_strips_running_header_and_footer():
+    text, stats = clean_pages(_slides(10))
+    assert "Grundlagen der Theoretischen Informatik" not in text
+    assert "Wintersemester 2024/25" not in text
+    assert "Heribert Vollmer" not in text
+    assert "06.01.25" not in text
+    assert "\n105\n" not in f"\n{text}\n"
+    assert stats['removed_lines'] == 50
+
+
+def test_keeps_headings_and_numeric_content():
+    text, _ = clean_pages(_slides(10))
+    assert text.count("Definition") == 5
+    assert "Aufgabe 2" in text and "Aufgabe 10" in text
+    assert text.count("x\n2") == 10
+
+
+def test_short_slides_only_lose_the_page_number():
+    pages = [f"Aufgabe {i}\nBerechne x\n2\n{i}" for i in range(1, 7)]
+    text, stats = clean_pages(pages)
+    assert text.count("Berechne x\n2") == 6
+    assert "Aufgabe 6" in text
+    assert stats['removed_lines'] == 6
+
+
+def test_mixed_page_lengths_strip_the_whole_header_and_footer():
+    pages = []
+    for i in range(1, 11):
+        body = ["Satz", "K ist nicht entscheidbar."]
+        if i % 2:
+            body += ["Beweis", "Angenommen K sei entscheidbar.", "Widerspruch."]
+        pages.append("\n".join(
+            ["Grundlagen der Theoretischen Informatik", "Wintersemester 2024/25"]
+            + body
+            + ["Prof. Dr. Heribert Vollmer", str(100 + i)]
+        ))
+    text, stats = clean_pages(pages)
+    assert "Grundlagen" not in text
+    assert "Wintersemester 2024/25" not in text
+    assert "Heribert Vollmer" not in text
+    assert "110" not in text
+    assert text.count("K ist nicht entscheidbar.") == 10
+    assert stats['removed_lines'] == 40
+
+
+def test_numbered_multi_word_headings_stay():
+    pages = [
+        f"Aufgabe {i} ({i + 2} Punkte)\nBerechne f({i})\nBeweis (Forts.)\nLösung folgt\nSeite {i} von 6"
+        for i in range(1, 7)
+    ]
+    text, _ = clean_pages(pages)
+    assert "Aufgabe 1 (3 Punkte)" in text and "Aufgabe 6 (8 Punkte)" in text
+    assert text.count("Beweis (Forts.)") == 6
+    assert "Seite" not in text
+
+
+def test_constant_number_is_not_a_page_number():
+    pages = [f"Satz {i} gilt\nx\n2" for i in range(1, 7)]
+    text, _ = clean_pages(pages)
+    assert text.count("x\n2") == 6
+
+
+def test_hyphen_joining():
+    assert normalise_text("Endliche Auto-\nmaten") == "Endliche Automaten"
+    assert normalise_text("Mehrband-\nMaschinen") == "Mehrband-\nMaschinen"
+    assert normalise_text("Ein-\nund Ausgabe") == "Ein-\nund Ausgabe"
+    assert normalise_text("ge-\nz 0") == "ge-\nz 0"
+    assert normalise_text("Programm-\ni1 i2") == "Programm-\ni1 i2"
+    assert normalise_text("a   b \n\n\n\nc") == "a b\n\nc"
+
+
+def test_empty_document():
+    text, stats = clean_pages([])
+    assert text == ""
+    assert stats['tokens_before'] == stats['tokens_after'] == 0
+
+
+def test_never_removes_everything():
+    pages = ["Grundlagen der Informatik"] * 5
+    text, stats = clean_pages(pages)
+    assert text
+    assert stats['removed_lines'] == 0
+
+
+def test_stats():
+    pages = _slides(10)
+    text, stats = clean_pages(pages)
+    assert stats['pages'] == 10
+    assert stats['tokens_before'] == (len("\n".join(pages)) + 3) // 4
+    assert stats['tokens_after'] == (len(text) + 3) // 4
+    assert stats['tokens_saved'] == stats['tokens_before'] - stats['tokens_after'] > 0